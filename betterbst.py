@@ -3,13 +3,16 @@ from __future__ import annotations
 from typing import List, Tuple, TypeVar
 
 from data_structures.bst import BinarySearchTree
-from algorithms.mergesort import mergesort
+from data_structures.node import TreeNode
 
 K = TypeVar('K')
 I = TypeVar('I')
 
 
 class BetterBST(BinarySearchTree[K, I]):
+    # Tree layouts already worked out, by number of elements (see _compute_mid_order)
+    _MID_ORDER_CACHE: dict[int, List[Tuple[int, int, int, int]]] = {}
+
     def __init__(self, elements: List[Tuple[K, I]]) -> None:
         """
         Initialiser for the BetterBST class.
@@ -27,14 +30,14 @@ class BetterBST(BinarySearchTree[K, I]):
 
         Complexity:
             Best Case Complexity: O(N* log N) - where N is the number of elements in the input list. The time complexity of
-                                    __sort_elements is O(N*logN) and __build_balanced_tree is O(N*logN). Hence overall
-                                    O(N*log N + N*logN) --> O(N* logN)
+                                    __sort_elements is O(N*logN) and __build_balanced_tree is O(N). Hence overall
+                                    O(N*log N + N) --> O(N* logN)
             Worst Case Complexity: O(N* log N) - Same as best case.
         """
         super().__init__()
         # O(__sort_elements) -> O(N*logN)
         new_elements: List[Tuple[K, I]] = self.__sort_elements(elements)
-        # O(__build_balanced_tree) -> O(N*logN)
+        # O(__build_balanced_tree) -> O(N)
         self.__build_balanced_tree(new_elements)
 
     def __sort_elements(self, elements: List[Tuple[K, I]]) -> List[Tuple[K, I]]:
@@ -50,12 +53,43 @@ class BetterBST(BinarySearchTree[K, I]):
             list(Tuple[K, I]]) - elements after being sorted.
 
         Complexity:
-            Best Case Complexity: O(N * log N) - where N is the number of elements. It uses mergesort complexity
-                                where it divides the list into smaller sublists until each list has one element,
-                                then merges them back in a sorted order.
+            Best Case Complexity: O(N * log N) - where N is the number of elements. It uses a bottom-up mergesort,
+                                merging adjacent sorted runs of width 1, 2, 4, ... until a single run remains.
+                                There are log N passes and each pass moves all N elements once.
             Worst Case Complexity: O(N * log N) - Same as best case.
         """
-        return mergesort(elements)
+        n = len(elements)
+        source: List[Tuple[K, I]] = list(elements)
+        # One scratch buffer for the whole sort, swapped with source after every pass
+        scratch: List[Tuple[K, I]] = [None] * n
+
+        width = 1
+        while width < n:
+            # Merge each pair of adjacent runs source[lo:mid] and source[mid:hi] into scratch[lo:hi]
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                i, j, k = lo, mid, lo
+                while i < mid and j < hi:
+                    # Compare keys only, taking from the left run on ties to keep the sort stable
+                    if source[j][0] < source[i][0]:
+                        scratch[k] = source[j]
+                        j += 1
+                    else:
+                        scratch[k] = source[i]
+                        i += 1
+                    k += 1
+
+                # At most one of the two runs has elements left over
+                if i < mid:
+                    scratch[k:hi] = source[i:mid]
+                else:
+                    scratch[k:hi] = source[j:hi]
+
+            source, scratch = scratch, source
+            width *= 2
+
+        return source
 
     def __build_balanced_tree(self, elements: List[Tuple[K, I]]) -> None:
         """
@@ -70,21 +104,19 @@ class BetterBST(BinarySearchTree[K, I]):
         Complexity:
             (This is the actual complexity of your code, 
             remember to define all variables used.)
-            Best Case Complexity: O(N * log N) - where N is the number of elements. It uses build_tree_aux complexity
-                                                of halving the range of elements recursively, which takes O(log N) time.
-                                                The __setitem__() magic method used to insert the element uses insertion,
-                                                which also takes O(log N) time as the tree is maintained balanced. In total
-                                                we perform N number of insertions for all elements. Hence overall O(N * log N).
-            Worst Case Complexity: O(N * log N) - Same as best case.
+            Best Case Complexity: O(N) - where N is the number of elements. Every element is turned into a TreeNode
+                                        once, and every node is then linked to its children exactly once.
+            Worst Case Complexity: O(N) - Same as best case.
 
         Justification:
-            1. The code recursively divides the input list into smaller sublists by selecting the middle element. Hence,
-            in each recursive call the range is halved resulting in a depth of log N.
+            1. Since the elements are already sorted, the root of any range [start, end] is its middle element, and
+            the roots of its left and right subtrees are the middle elements of [start, mid - 1] and [mid + 1, end].
+            These indices can be computed directly, so nodes are linked without searching down the tree.
 
-            2. For each N elements, the insertion is done with '__setitem__()' magic method, which inserts the element into
-            the BST. In a balanced tree where the height is maintained at log N, the overall insertion time is O(N * log N).
+            2. The size of the subtree rooted at the middle of [start, end] is simply end - start + 1, so no
+            insertion through '__setitem__()' (and no O(log N) descent per element) is needed.
 
-            As a result, the overall time complexity for building a balance tree is O(N * log N), where N is the number
+            As a result, the overall time complexity for building a balance tree is O(N), where N is the number
             of elements in the input list.
 
         Complexity requirements for full marks:
@@ -92,43 +124,143 @@ class BetterBST(BinarySearchTree[K, I]):
             Worst Case Complexity: O(n * log(n))
             where n is the number of elements in the list.
         """
-        # Call the recursive auxiliary function to build the tree
-        self.build_tree_aux(elements, 0, len(elements) - 1)
+        # O(_build_nodes_direct) -> O(N)
+        self.root, self.length = self._build_nodes_direct(elements, 0, len(elements) - 1)
 
-    def build_tree_aux(self, sorted_elements: List[Tuple[K, I]], start: int, end: int) -> None:
+    def _build_nodes_direct(self, sorted_elements: List[Tuple[K, I]], start: int, end: int) -> Tuple[TreeNode | None, int]:
         """
-        Recursively builds the balanced tree by inserting the middle element of the list.
+        Builds a balanced subtree out of sorted_elements[start..end] by creating the TreeNodes directly,
+        without going through '__setitem__()'.
 
         Args:
-            sorted_elements (List[Tuple[K, I]]): The sorted elements from which to build the tree.
-            start (int): The starting index of the current sublist.
-            end (int): The ending index of the current sublist.
+            sorted_elements (List[Tuple[K, I]]): The sorted elements from which to build the subtree.
+            start (int): The starting index of the range (inclusive).
+            end (int): The ending index of the range (inclusive).
 
         Returns:
-            None
+            Tuple[TreeNode | None, int] - the root of the subtree (None if the range is empty) and its size.
 
         Complexity:
-            Best Case Complexity: O(N * log N) - where N is the number of elements. It divides the range of elements recursively
-                                                by taking the middle element and halving into left smaller sublists and right larger sublists.
-                                                Hence this division process takes O(log N) time. The __setitem__() magic
-                                                method from BST used to insert the element uses insertion, which also takes O(log N)
-                                                time as the tree is maintained balanced. In total we perform N number of
-                                                insertions for all elements. Hence overall O(N * log N)
-            Worst Case Complexity: O(N * log N) - Same as best case.
+            Best Case Complexity: O(1) - when the range is empty.
+            Worst Case Complexity: O(N) - where N is end - start + 1. Every element is turned into a TreeNode once,
+                                        and every node is linked to its children exactly once.
         """
-        # Base case: empty sublist
-        if start > end:
-            return
+        size = end - start + 1
+        if size <= 0:
+            return None, 0
+
+        # O(N) - create every node up front, in the same (sorted) order as the elements
+        nodes = [TreeNode(key, item=item) for key, item in sorted_elements[start:end + 1]]
+
+        # O(N) - link every node to its children using the layout for this many elements
+        for mid, left, right, subtree_size in self._compute_mid_order(size):
+            node = nodes[mid]
+            node.subtree_size = subtree_size
+            if left >= 0:
+                node.left = nodes[left]     # Left subtree
+            if right >= 0:
+                node.right = nodes[right]   # Right subtree
 
+        return nodes[(size - 1) >> 1], size
+
+    def _delete_node(self, path: List[TreeNode]) -> List[TreeNode]:
+        """
+        Removes a node that has already been found, without searching for its key again.
+
+        Unlike deleting by key, the removed node is unlinked rather than overwritten, so its key and item
+        stay valid after the call. A node with two children is replaced by its in-order successor.
+
+        Args:
+            path (List[TreeNode]): The nodes from the root down to the node to remove, both inclusive.
+
+        Returns:
+            List[TreeNode] - the nodes still in the tree whose subtrees have changed, ordered from the root down.
+
+        Complexity:
+            Best Case Complexity: O(log N) - where N is the number of elements. The subtree_size of every ancestor
+                                    on the path is decremented, and the path is at most the height of the tree.
+            Worst Case Complexity: O(log N) - Same as best case, plus the walk down to the successor, which is also
+                                    bounded by the height of the tree.
+        """
+        node = path[-1]
+        ancestors = path[:-1]
+        changed = list(ancestors)
+
+        if node.left is None or node.right is None:
+            # At most one child, which simply takes the node's place
+            replacement = node.left if node.left is not None else node.right
         else:
-            # Find the middle index
-            mid = (start + end) // 2
+            # Two children: detach the in-order successor (leftmost node of the right subtree) and put it in place
+            successor_chain = []
+            replacement = node.right
+            while replacement.left is not None:
+                successor_chain.append(replacement)
+                replacement = replacement.left
+
+            if successor_chain:
+                successor_chain[-1].left = replacement.right
+                replacement.right = node.right
+            replacement.left = node.left
+            replacement.subtree_size = node.subtree_size - 1
+
+            for chain_node in successor_chain:
+                chain_node.subtree_size -= 1
+            changed.append(replacement)
+            changed.extend(successor_chain)
+
+        # Link the replacement to the removed node's parent
+        if not ancestors:
+            self.root = replacement
+        elif ancestors[-1].left is node:
+            ancestors[-1].left = replacement
+        else:
+            ancestors[-1].right = replacement
+
+        for ancestor in ancestors:
+            ancestor.subtree_size -= 1
+        self.length -= 1
+
+        node.left = node.right = None
+        return changed
+
+    @classmethod
+    def _compute_mid_order(cls, n: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Works out, once per number of elements, the shape of the balanced tree built over n sorted elements.
+
+        The root of any range [lo, hi] is its middle element, and the roots of its two halves are the middles
+        of [lo, mid - 1] and [mid + 1, hi]. This only depends on n, so the result is cached and reused by
+        every later tree of the same size.
+
+        Args:
+            n (int): The number of elements in the tree.
+
+        Returns:
+            List[Tuple[int, int, int, int]] - one (mid, left, right, subtree_size) entry per node, in pre-order.
+                                              left and right are the indices of the children, or -1 if missing.
+
+        Complexity:
+            Best Case Complexity: O(1) - when the layout for n is already cached.
+            Worst Case Complexity: O(N) - where N is n, every range is split exactly once.
+        """
+        mid_order = cls._MID_ORDER_CACHE.get(n)
+        if mid_order is not None:
+            return mid_order
 
-            # Insert the middle element into the BST
-            key, value = sorted_elements[mid]
-            self[key] = value
+        mid_order = []
+        ranges = [(0, n - 1)] if n > 0 else []
+        while ranges:
+            lo, hi = ranges.pop()
+            mid = (lo + hi) >> 1
+            left = (lo + mid - 1) >> 1 if lo < mid else -1
+            right = (mid + 1 + hi) >> 1 if mid < hi else -1
+            mid_order.append((mid, left, right, hi - lo + 1))
 
-            # Recursively build the left and right subtrees
-            self.build_tree_aux(sorted_elements, start, mid - 1)  # Left subtree
-            self.build_tree_aux(sorted_elements, mid + 1, end)    # Right subtree
+            # Right pushed first so the left half is split first, giving pre-order
+            if mid < hi:
+                ranges.append((mid + 1, hi))
+            if lo < mid:
+                ranges.append((lo, mid - 1))
 
+        cls._MID_ORDER_CACHE[n] = mid_order
+        return mid_order
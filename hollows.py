@@ -77,10 +77,10 @@ class SpookyHollow(Hollow):
         Complexity:
             (This is the actual complexity of your code,
             remember to define all variables used.)
-            Best Case Complexity: O(N * log N) - where N is the number of treasures. It will loop N times to add
+            Best Case Complexity: O(N * log N) - where N is the number of treasures. It will loop N times to collect
                                 the treasures into a list before constructing the BST. Then it takes O(N * log N) time
                                 to construct the list into a BetterBST, where it uses mergesort to sort the treasures and
-                                building a balance tree.
+                                building a balance tree. Finally every node is annotated with its subtree's min_weight in O(N).
                                 Please refer to "__build_balanced_tree" and "__sort_elements" in betterbst.py for detailed time complexity
             Worst Case Complexity: O(N * log N) - Same as best case. 
 
@@ -89,19 +89,19 @@ class SpookyHollow(Hollow):
             Worst Case Complexity: O(n log n)
             Where n is the number of treasures in the hollow
         """
-        treasure_tuples = []
         # O(N) - where N is the number of treasures in self.treasures. Best and worst case are same since each treasure
-        # is iterated to calculate the ratio and appending it to the list.
-        # Negative sign used here is to add the elements into the tree descendingly for future in-order traversal purpose
-        for treasure in self.treasures:
-            ratio = -treasure.value / treasure.weight
-            treasure_tuples.append((ratio, treasure))
+        # is iterated to read its cached ratio and build the list.
+        treasure_tuples = [(treasure.ratio, treasure) for treasure in self.treasures]
 
         # O(N*log N) - where N is the number of treasures. It will construct the better BST by first sorting all the
         # treasures according to the ratio with mergesort, which takes O(N*log N) time.
         # Please refer to __build_balanced_tree and __sort_elements for detailed time complexity
         self.treasures = BetterBST(treasure_tuples)
 
+        # O(N) - where N is the number of treasures. Record the lightest weight found in every subtree,
+        # so get_optimal_treasure can skip subtrees in which nothing fits the backpack.
+        self._annotate_min_weight()
+
     def get_optimal_treasure(self, backpack_capacity: int) -> Treasure | None:
         """
         Removes the ideal treasure from the hollow
@@ -122,46 +122,89 @@ class SpookyHollow(Hollow):
             (This is the actual complexity of your code,
             remember to define all variables used.)
             Best Case Complexity: O(log N) - where N is the number of treasures in the hollow. Best case occurs when
-                                    the optimal treasure is found at the first retrieval which takes log N time, in a
-                                    in-order traversal manner, which will be the leftmost element in this negated BST.
-            Worst Case Complexity: O(N) - where N is the number of treasures in the hollow. Worst case occurs when
-                                    the optimal treasure is found after several traversals in the BST in looking for
-                                    the best treasure fitting within backpack capacity.
+                                    no treasure fits, which is known from the root's min_weight in O(1), or
+                                    the optimal treasure is found by a single descent from the root, as every node
+                                    stores the lightest weight in its subtree. The descent and the deletion are both
+                                    bounded by the height of the balanced BST, which is log N.
+            Worst Case Complexity: O(log N) - Same as best case, the descent never needs to backtrack.
 
         Complexity requirements for full marks:
             Best Case Complexity: O(log(n))
             Worst Case Complexity: O(n)
             n is the number of treasures in the hollow
         """
-        # Initialize variables for optimal treasure and its node
-        optimal_treasure = None
+        # Initialize the node holding the optimal treasure
         optimal_treasure_node = None
 
-        # Iterate through treasures using in-order traversal
-        # The first value onwards after multiplying (negative sign) again is in descending order,
-        # hence it is checking the most optimal treasure with the greatest value/weight ratio.
-        # Best case: O(log N) - where N is the number of treasures. The leftmost item in the in-order traversal is
-        # retrieved in log N time, which is the highest ratio after negating it.
-        # Worst case: O(N) - where N is the number of treasures to be iterated. Occurs if the first item is not optimal,
-        # it will sequentially visit all the other nodes in-orderly (left subtree to current node to right subtree).
-        for node in self.treasures:
-            ratio, treasure = -node.key, node.item  # Convert back to positive ratio
-
-            # Check if the treasure fits within the backpack capacity
-            if treasure.weight <= backpack_capacity:
-                optimal_treasure = treasure
-                optimal_treasure_node = node
-                break
+        # The reverse in-order sequence of this BST is in descending order of value/weight ratio, so the optimal
+        # treasure is the rightmost node whose treasure fits within the backpack capacity.
+        # O(log N) - where N is the number of treasures. A subtree is only entered if its min_weight fits, which
+        # guarantees a suitable treasure inside it, hence the search goes down one path and never backtracks.
+        path = []
+        node = self.treasures.root
+        if node is not None and node.min_weight <= backpack_capacity:
+            while True:
+                path.append(node)
+                if node.right is not None and node.right.min_weight <= backpack_capacity:
+                    node = node.right
+                elif node.item.weight <= backpack_capacity:
+                    optimal_treasure_node = node
+                    break
+                else:
+                    node = node.left
 
         # If a suitable treasure is found, delete it and return
-        # Delete here uses log N time to search for the node in a balanced BST and remove it.
-        if optimal_treasure:
-            del self.treasures[optimal_treasure_node.key]
-            return optimal_treasure
+        # The descent already recorded the path to the node, so it is unlinked directly in log N time.
+        if optimal_treasure_node is not None:
+            changed = self.treasures._delete_node(path)
+
+            # O(log N) - refresh min_weight bottom-up along every node whose subtree changed
+            for node in reversed(changed):
+                self._update_min_weight(node)
+
+            return optimal_treasure_node.item
 
         # Return None if no suitable treasure is found
         return None
 
+    def _annotate_min_weight(self) -> None:
+        """
+        Stores on every node of the treasures BST the minimum treasure weight in the subtree rooted at that node.
+
+        Complexity:
+            Best Case Complexity: O(N) - where N is the number of treasures, every node is visited twice.
+            Worst Case Complexity: O(N) - Same as best case.
+        """
+        # Collect the nodes in pre-order, so that every node comes before its children
+        nodes = []
+        stack = [self.treasures.root] if self.treasures.root is not None else []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+
+        # Children are therefore always updated before their parent
+        for node in reversed(nodes):
+            self._update_min_weight(node)
+
+    @staticmethod
+    def _update_min_weight(node) -> None:
+        """
+        Recomputes node.min_weight from its own treasure and its children, which must already be up to date.
+
+        Complexity:
+            O(1)
+        """
+        min_weight = node.item.weight
+        if node.left is not None and node.left.min_weight < min_weight:
+            min_weight = node.left.min_weight
+        if node.right is not None and node.right.min_weight < min_weight:
+            min_weight = node.right.min_weight
+        node.min_weight = min_weight
+
     def __str__(self) -> str:
         return Tiles.SPOOKY_HOLLOW.value
 
@@ -186,7 +229,7 @@ class MysticalHollow(Hollow):
             (This is the actual complexity of your code,
             remember to define all variables used.)
             Best Case Complexity: O(N) - where N is the number of treasures in the hollow. It iterates over all N
-                                        number of treasures, calculating their ratio and adding them into the heap.
+                                        number of treasures, reading their ratio and adding them into the heap.
                                         Uses the time complexity mainly for adding the treasures into a list, and heapify method. 
             Worst Case Complexity: O(N) - Same as best case.
 
@@ -196,11 +239,8 @@ class MysticalHollow(Hollow):
             Where n is the number of treasures in the hollow
         """
         # O(N) - where N is the number of treasures in self.treasures. Best and worst case are same since each treasure
-        # is iterated to calculate the ratio and appending it to the list.
-        treasure_tuples = []
-        for treasure in self.treasures:
-            ratio = treasure.value / treasure.weight
-            treasure_tuples.append((ratio, treasure))
+        # is iterated to read its cached ratio and build the list.
+        treasure_tuples = [(treasure.ratio, treasure) for treasure in self.treasures]
 
         # O(N) - where N is the number of treasures. It will construct a MaxHeap with the treasure tuples.
         # Overall time complexity occurs from heapify method from MaxHeap. 
@@ -226,52 +266,70 @@ class MysticalHollow(Hollow):
             (This is the actual complexity of your code,
             remember to define all variables used.)
             Best Case Complexity: O(log N) - where N is the number of treasures in the hollow. Best case occurs when the
-                                    first get_max treasure's weight is within the backpack capacity, then it will break
-                                    and return the treasure without checking temp_storage. Overall complexity depends on
-                                    get_max() which is log N. Hence O(log N) in general.
-            Worst Case Complexity: O(N * log N) - where N is the number of treasures in the hollow. Worst case occurs
-                                    when the max ratio treasure is not within the backpack capacity, it will append it
-                                    to a temporary storage for future usage (adding back to heap). Then it will continue
-                                    iterating to get the next maximum ratio treasure, until it can fit into capacity.
-                                    Overall, getting optimal treasure requires N number of times to iterate each treasure
-                                    and log N time to get_max. Same goes to adding back the elements in the temporary storage
-                                    into heap, it takes O(N * log N) time too, N number of elements in temp_storage and
-                                    log N time to add.
+                                    maximum ratio treasure at the top of the heap is within the backpack capacity, so
+                                    it is taken straight away with get_max(), which is log N.
+            Worst Case Complexity: O(N) - where N is the number of treasures in the hollow. Worst case occurs when the
+                                    maximum ratio treasure is too heavy. The underlying heap array is then scanned once
+                                    for the best ratio treasure that fits, which is N, and only that treasure is
+                                    removed from its position in the heap, which is log N. Hence O(N + log N) --> O(N).
 
         Complexity requirements for full marks:
             Best Case Complexity: O(log n)
             Worst Case Complexity: O(n log n)
             Where n is the number of treasures in the hollow
         """
-        optimal_treasure = None
-        temp_storage = []
-
-        # Best case: O(log N) - where N is the number of treasures in the hollow. It immediately break and return the treasure
-        # once the maximum ratio treasure's weight is within backpack capacity.
-        # Worst case: O(N * log N) - where N is the number of treasures in the hollow. It will iterate N time getting the max 
-        # and removing it until the weight is within backpack capacity, only when the treasure is retrieved or no more treasures
-        # left it will break. 
-        while optimal_treasure is None:
-            if len(self.treasures) == 0:
-                break
-            # Extract the maximum ratio treasure
-            ratio, treasure = self.treasures.get_max()
-
-            if treasure.weight <= backpack_capacity:
-                optimal_treasure = treasure
-                break
-            else:
-                temp_storage.append((ratio, treasure))
-
-        # Add back all treasures that were not suitable
-        # Best case: O(1) if temp_storage is empty
-        # Worst case: O(N * log N) where N is the number of treasures. If temp storage contain elements, it will iterate
-        # each of them and add back into the heap.
-        if temp_storage:
-            for (ratio, treasure) in temp_storage:
-                self.treasures.add((ratio, treasure))
-
-        return optimal_treasure
+        heap = self.treasures
+        if len(heap) == 0:
+            return None
+
+        # Best case: O(log N) - where N is the number of treasures in the hollow. The maximum ratio treasure fits,
+        # so it is simply extracted from the top of the heap.
+        if heap.the_array[1][1].weight <= backpack_capacity:
+            return heap.get_max()[1]
+
+        # Worst case: O(N) - where N is the number of treasures in the hollow. Scan the heap array in place (it is
+        # 1-indexed) for the greatest ratio treasure within backpack capacity, without removing anything.
+        best_index = 0
+        for index in range(2, len(heap) + 1):
+            ratio, treasure = heap.the_array[index]
+            if treasure.weight <= backpack_capacity and (best_index == 0 or ratio > heap.the_array[best_index][0]):
+                best_index = index
+
+        if best_index == 0:
+            return None
+
+        # O(log N) - remove only the chosen treasure from the heap
+        return self._remove_at(best_index)[1]
+
+    def _remove_at(self, index: int) -> tuple[float, Treasure]:
+        """
+        Removes the element at the given position of the underlying heap array,
+        keeping the rest of the heap valid.
+
+        Args:
+            index (int): The (1-indexed) position in the heap array of the element to remove.
+
+        Returns:
+            tuple[float, Treasure] - the removed (ratio, treasure) element.
+
+        Complexity:
+            Best Case Complexity: O(1) - when the removed element is the last one in the heap array.
+            Worst Case Complexity: O(log N) - where N is the number of treasures in the hollow. The last element
+                                    is moved into the gap and has to rise or sink through the height of the heap.
+        """
+        heap = self.treasures
+        removed = heap.the_array[index]
+        last = heap.the_array[heap.length]
+        heap.length -= 1
+
+        if index <= heap.length:
+            # Fill the gap with the last element, then restore the heap order around it.
+            # Only one of these will move it: if it rises, the slot is refilled by its old parent, which sink leaves alone.
+            heap.the_array[index] = last
+            heap.rise(index)
+            heap.sink(index)
+
+        return removed
 
     def __str__(self) -> str:
         return Tiles.MYSTICAL_HOLLOW.value
@@ -337,20 +337,20 @@ class Maze:
                                     treasures in the hollow. Best case occurs when a spooky hollow is encountered,
                                     and the best case of spooky_hollow.get_optimal_treasure when spooky hollow occurred.
                                     Please refer to "spooky_hollow.get_optimal_treasure" for more time complexity analysis.
-            Worst Case Complexity: O(N * (T * log T)) - where N is the number of cells throughout the path, and T is
+            Worst Case Complexity: O(N * T) - where N is the number of cells throughout the path, and T is
                                     the number of treasures in the hollow. Worst case when the hollow is mystical,
-                                    mystical requires  O(T * log T) in the worst case for mystical_hollow.get_optimal_treasure().
+                                    mystical requires O(T) in the worst case for mystical_hollow.get_optimal_treasure().
                                     Please refer to "mystical_hollow.get_optimal_treasure" for more time complexity analysis.
             
                         - Overall, it will loop through each cell in the path to check if the tile is a hollow, if it is, the 
                         time complexity depends if its a spooky hollow or a mystical hollow. If both are met, it will still 
-                        follow the worst case of O(N * (T * log T)).
+                        follow the worst case of O(N * T).
 
         """
         treasures_taken = []
 
         # Best case: O(N * (log T)) - where N is the number of cells throughout the path. Occurs when spooky hollow encountered.
-        # Worst case: O(N * (T * log T)) - where T is the number of treasures collected. Worst case occurs when mystical hollow encountered,
+        # Worst case: O(N * T) - where T is the number of treasures in the hollow. Worst case occurs when mystical hollow encountered,
         for cell in path:
             if isinstance(cell.tile, Hollow):
                 # Attempt to get the optimal treasure within capacity
@@ -358,7 +358,7 @@ class Maze:
 
                 # If optimal treasure is found and weight within backpack capacity, the treasure is appended into a list
                 # and subtraction on the backpack capacity is performed.
-                if optimal_treasure and optimal_treasure.weight <= backpack_capacity:
+                if optimal_treasure is not None and optimal_treasure.weight <= backpack_capacity:
                     treasures_taken.append(optimal_treasure)
                     backpack_capacity -= optimal_treasure.weight
 
@@ -5,6 +5,8 @@ from random_gen import RandomGen
 from typing import List
 
 class Treasure:
+    __slots__ = ('value', 'weight', 'ratio')
+
     def __init__(self, value: int, weight: int) -> None:
         """
         Complexity:
@@ -16,6 +18,8 @@ class Treasure:
         """
         self.value: int = value
         self.weight: int = weight
+        # Treasures are not changed after creation, so the value / weight ratio is only computed once
+        self.ratio: float = value / weight
 
     def __eq__(self, value: object) -> bool:
         # Do not modify this function
@@ -64,11 +68,15 @@ def generate_treasures() -> List[Treasure]:
     while treasure_count < number_of_treasures:
         weight: int = RandomGen.randint(1, TreasureConfig.MAX_TREASURE_WEIGHT.value)
         value: int = RandomGen.randint(1, TreasureConfig.MAX_TREASURE_WEIGHT.value)
-        ratio: float = value / weight
 
-        if ratio not in ratios and weight not in weights_used and value not in values_used:
-            hollow_treasures[treasure_count] = Treasure(value, weight)
-            ratios.add(ratio)
+        # Most rejected draws repeat a weight or value, so check those before building the treasure and its ratio
+        if weight in weights_used or value in values_used:
+            continue
+
+        treasure: Treasure = Treasure(value, weight)
+        if treasure.ratio not in ratios:
+            hollow_treasures[treasure_count] = treasure
+            ratios.add(treasure.ratio)
             weights_used.add(weight)
             values_used.add(value)
             treasure_count += 1